@@ -17,104 +17,238 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from itertools import product
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import io
+import os
 from typing import Optional
 import string
 
-Table = list[list[tuple[int, ...], int]]
+import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Number of input symbols from which sum_of_min_terms switches from the
+# single packed integer to the Numba kernel over 64-bit words (if available).
+NUMBA_MIN_INPUTS = 21
+
+# Number of input symbols from which eval_column evaluates the two subtrees
+# of the root gate in parallel threads.
+PARALLEL_MIN_INPUTS = 18
+
+# Only the root gate may split off a thread: nested submits from within the
+# pool could starve it of workers and deadlock on small pools.
+_PARALLEL_MAX_DEPTH = 1
+
+_executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    '''
+        Return the shared thread pool, creating it on first use.
+    '''
+
+    global _executor  # pylint: disable=global-statement
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+    return _executor
+
+# Truth tables are stored as the output column only: a (2**n,) uint8 vector
+# whose row index encodes the input values (bit n-1-k of the index is the
+# value of the k-th symbol counted from the left).
+Table = np.ndarray
 
 class Gate:
-    def __init__(self, expression: str):
-        self.truth_table = []
-        self.expression = normalize_bool_fct_str(expression.strip())
-        self.output = 0
+    # One slot per attribute set during parsing; "operator" stays a class
+    # attribute on the subclasses and therefore must not be slotted.
+    __slots__ = (
+        "truth_table",
+        "expression",
+        "output",
+        "inp_1",
+        "inp_2",
+        "_key",
+        "_input_symbols",
+        "_topo",
+        "_column",
+    )
+
+    def __new__(cls, expression: str = ""):
+        if cls is not Gate:
+            return object.__new__(cls)
 
-        if self.expression[0] in {"'", "*", "+", "!"}:
+        norm, input_symbols = normalize_bool_fct_str(expression)
+
+        if norm[0] in {"'", "*", "+", "!"}:
             raise ValueError(
                 f"Expression or sub-expression cannot start with an operator: {expression}!"
             )
 
-        if par_open := self.expression.count("("):
-            par_closed = self.expression.count(")")
-            if par_open != par_closed:
-                raise ValueError("Unmatched paranthesis!")
-
-            i_open, i_close = parse_outer_paranthesis(self.expression)
-
-            len_expr = len(self.expression)
-            if i_open == 0 and i_close == len_expr - 2:
-                self.operator = "NOT"
-                self.inp_1 = Gate(self.expression[1:-2])
-                self.inp_2 = None
-            elif i_open == 0 and i_close == len_expr - 1:
-                self.operator = "UNITY"
-                self.inp_1 = Gate(self.expression[1:-1])
-                self.inp_2 = None
-            else:
-                split_at = i_open - 2 if i_open > 0 else i_close
-                if self.expression[split_at + 1] in {"'", "!"}:
-                    split_at += 1
-                expr_1 = self.expression[: split_at + 1]
-                expr_2 = self.expression[split_at + 1 :]
-
-                match self.expression[split_at + 1]:
-                    case "*":
-                        self.operator = "AND"
-                    case "+":
-                        self.operator = "OR"
-                    case _:
-                        raise NotImplementedError("Unknown operator encountered!")
-
-                self.inp_1 = Gate(expr_1) if expr_1 else None
-                self.inp_2 = Gate(expr_2) if expr_2 else None
-        elif self.expression.count("+"):
-            expr = self.expression.split("+", maxsplit=1)
-            self.operator = "OR"
-            self.inp_1 = Gate(expr[0])
-            self.inp_2 = Gate(expr[1])
-        elif self.expression.count("*"):
-            expr = self.expression.split("*", maxsplit=1)
-            self.operator = "AND"
-            self.inp_1 = Gate(expr[0])
-            self.inp_2 = Gate(expr[1])
-        elif not_ops := self.expression.count("'") + self.expression.count("!"):
-            self.operator = "NOT" if not_ops % 2 != 0 else "UNITY"
-            self.inp_1 = Gate(self.expression[0])
-            self.inp_2 = None
-        else:
-            self.inp_1 = None
-            self.inp_2 = None
-            self.operator = "INPUT"
+        if norm.count("(") != norm.count(")"):
+            raise ValueError("Unmatched paranthesis!")
+
+        root = parse_expression(norm)
 
-    def update(self, inputs: dict):
+        if root.operator == "INPUT" and root.expression != norm:
+            root = _new_gate("UNITY", inp_1=root)
+
+        root.expression = norm
+        root._input_symbols = input_symbols
+        root._topo = _flatten_post_order(root)
+
+        for gate in root._topo:
+            if isinstance(gate, InputGate):
+                gate.inp_idx = input_symbols.index(gate.expression)
+
+        return root
+
+    def update(self, inputs: tuple):
         '''
             Update the output of the gate.
 
-            inputs: a dict containing True/1 and False/0 values for all
-                    input variables.
+            The flattened gate list is walked iteratively (children before
+            parents), so deep expressions use a single Python frame instead
+            of one per node.
+
+            inputs: sequence of True/1 and False/0 values, one per input
+                    variable in reversed alphabetical order (the order of
+                    the symbols collected by normalize_bool_fct_str).
         '''
 
-        if self.inp_1 is not None:
-            self.inp_1.update(inputs)
+        for gate in self._get_topo():
+            gate._step(inputs)
 
-        if self.inp_2 is not None:
-            self.inp_2.update(inputs)
+    def _step(self, inputs):
+        '''
+            Compute the output of this gate from its already updated inputs.
+        '''
 
-        match self.operator:
-            case "AND":
-                self.output = self.inp_1.output and self.inp_2.output
-            case "OR":
-                self.output = self.inp_1.output or self.inp_2.output
-            case "NOT":
-                self.output = not self.inp_1.output
-            case "INPUT":
-                self.output = inputs[self.expression]
-            case "UNITY":
-                self.output = self.inp_1.output
-            case _:
-                raise NotImplementedError
+        raise NotImplementedError
+
+    def _column_op(self, columns: dict, mask: int, cache: dict) -> int:
+        '''
+            Compute the packed output column of this gate from the already
+            cached columns of its inputs.
+        '''
+
+        raise NotImplementedError
+
+    def _word_expression(self, symbol_index: dict) -> str:
+        '''
+            Render this subtree as a Python expression over indexed uint64
+            word reads, e.g. "(columns[0, w] & ~columns[1, w])", for the
+            Numba kernel (see eval_column_words).
+
+            symbol_index: dict mapping each input symbol to its row in the
+                          word-column array.
+        '''
+
+        raise NotImplementedError
+
+    def _int_expression(self) -> str:
+        '''
+            Render this subtree as a Python expression over the packed
+            per-symbol column integers, with the input symbols as free
+            variables (see compile_column_function).
+        '''
+
+        raise NotImplementedError
+
+    def _get_topo(self) -> list["Gate"]:
+        '''
+            Return the gate tree flattened into post-order (children before
+            parents), computing and caching it on first use.
+        '''
+
+        try:
+            return self._topo
+        except AttributeError:
+            self._topo = _flatten_post_order(self)
+            return self._topo
+
+    def eval_column(
+        self,
+        columns: dict,
+        mask: int,
+        cache: Optional[dict] = None,
+        depth: int = 0,
+    ) -> int:
+        '''
+            Evaluate the whole output column of the gate in one go.
+
+            The column is packed into a single integer in which bit i holds
+            the output for the input combination in row i of the truth table.
+            All rows are processed with one bitwise operation per gate
+            instead of one update() call per row. Structurally identical
+            subtrees are evaluated only once per call via the cache, which
+            is keyed by the structural key computed at parse time. For wide
+            columns (PARALLEL_MIN_INPUTS or more inputs) the two subtrees of
+            the root gate are evaluated in parallel threads.
+
+            columns: dict mapping each input symbol to its packed column
+                     (see input_columns).
+            mask: bit mask with one bit per row, i.e. 2**2**n - 1.
+            cache: dict mapping structural keys to already computed columns
+                   [optional].
+            depth: nesting level, used to restrict the parallel split to
+                   the top of the tree; the tree itself is evaluated
+                   iteratively in post-order.
+
+            Returns the packed output column as int.
+        '''
+
+        if cache is None:
+            cache = {}
+
+        if self._key in cache:
+            return cache[self._key]
+
+        if (
+            isinstance(self, (AndGate, OrGate))
+            and depth < _PARALLEL_MAX_DEPTH
+            and mask.bit_length() >= 1 << PARALLEL_MIN_INPUTS
+        ):
+            future = _get_executor().submit(
+                self.inp_1.eval_column, columns, mask, cache, depth + 1
+            )
+            column_2 = self.inp_2.eval_column(columns, mask, cache, depth + 1)
+            column_1 = future.result()
+
+            if isinstance(self, AndGate):
+                column = column_1 & column_2
+            else:
+                column = column_1 | column_2
+
+            cache[self._key] = column
+
+            return column
+
+        for gate in self._get_topo():
+            if gate._key not in cache:
+                cache[gate._key] = gate._column_op(columns, mask, cache)
+
+        return cache[self._key]
+
+    def eval_numpy(self, columns: dict) -> np.ndarray:
+        '''
+            Evaluate the output column of the gate on NumPy input columns.
+
+            Mirrors eval_column, but operates element-wise on uint8 arrays
+            holding one entry per truth-table row, so every gate becomes a
+            single vectorized bitwise operation.
+
+            columns: dict mapping each input symbol to its uint8 column
+                     (see input_columns_numpy).
+
+            Returns the output column as np.ndarray of uint8.
+        '''
+
+        raise NotImplementedError
 
     def print_truth_table(self):
         '''
@@ -124,86 +258,491 @@ class Gate:
         if len(self.truth_table) == 0:
             generate_truth_table(self)
 
-        input_symbols = extract_input_symbols(self.expression)
-        print_truth_table(self.truth_table, input_symbols)
+        print_truth_table(self.truth_table, self._input_symbols)
 
-    def print_sum_of_minterms(self):
+    def print_sum_of_minterms(self, minimize: bool = False):
         '''
             Prints the canonical sum of minterms form of the boolean expression.
+
+            minimize: print a minimized sum-of-products form instead of the
+                      canonical one (see minimize_minterms).
         '''
 
-        print(sum_of_min_terms(self))
+        print(sum_of_min_terms(self, minimize))
+
+
+class InputGate(Gate):
+    '''
+        Leaf gate passing through the value of one input variable.
+    '''
+
+    __slots__ = ("inp_idx",)
+
+    operator = "INPUT"
+
+    def _step(self, inputs):
+        self.output = inputs[self.inp_idx]
+
+    def _column_op(self, columns: dict, mask: int, cache: dict) -> int:
+        return columns[self.expression]
+
+    def eval_numpy(self, columns: dict) -> np.ndarray:
+        return columns[self.expression]
+
+    def _word_expression(self, symbol_index: dict) -> str:
+        return f"columns[{symbol_index[self.expression]}, w]"
+
+    def _int_expression(self) -> str:
+        return self.expression
+
+
+class NotGate(Gate):
+    '''
+        Gate inverting its single input.
+    '''
+
+    __slots__ = ()
+
+    operator = "NOT"
+
+    def _step(self, inputs):
+        self.output = self.inp_1.output ^ 1
+
+    def _column_op(self, columns: dict, mask: int, cache: dict) -> int:
+        return ~cache[self.inp_1._key] & mask
+
+    def eval_numpy(self, columns: dict) -> np.ndarray:
+        return self.inp_1.eval_numpy(columns) ^ 1
+
+    def _word_expression(self, symbol_index: dict) -> str:
+        return f"(~{self.inp_1._word_expression(symbol_index)})"
+
+    def _int_expression(self) -> str:
+        return f"(~{self.inp_1._int_expression()} & mask)"
+
+
+class AndGate(Gate):
+    '''
+        Gate combining its two inputs with logical AND.
+    '''
+
+    __slots__ = ()
+
+    operator = "AND"
+
+    def _step(self, inputs):
+        self.output = self.inp_1.output & self.inp_2.output
+
+    def _column_op(self, columns: dict, mask: int, cache: dict) -> int:
+        return cache[self.inp_1._key] & cache[self.inp_2._key]
+
+    def eval_numpy(self, columns: dict) -> np.ndarray:
+        return self.inp_1.eval_numpy(columns) & self.inp_2.eval_numpy(columns)
+
+    def _word_expression(self, symbol_index: dict) -> str:
+        inp_1 = self.inp_1._word_expression(symbol_index)
+        inp_2 = self.inp_2._word_expression(symbol_index)
+        return f"({inp_1} & {inp_2})"
+
+    def _int_expression(self) -> str:
+        return f"({self.inp_1._int_expression()} & {self.inp_2._int_expression()})"
+
+
+class OrGate(Gate):
+    '''
+        Gate combining its two inputs with logical OR.
+    '''
+
+    __slots__ = ()
+
+    operator = "OR"
+
+    def _step(self, inputs):
+        self.output = self.inp_1.output | self.inp_2.output
+
+    def _column_op(self, columns: dict, mask: int, cache: dict) -> int:
+        return cache[self.inp_1._key] | cache[self.inp_2._key]
+
+    def eval_numpy(self, columns: dict) -> np.ndarray:
+        return self.inp_1.eval_numpy(columns) | self.inp_2.eval_numpy(columns)
+
+    def _word_expression(self, symbol_index: dict) -> str:
+        inp_1 = self.inp_1._word_expression(symbol_index)
+        inp_2 = self.inp_2._word_expression(symbol_index)
+        return f"({inp_1} | {inp_2})"
+
+    def _int_expression(self) -> str:
+        return f"({self.inp_1._int_expression()} | {self.inp_2._int_expression()})"
+
+
+class UnityGate(Gate):
+    '''
+        Gate passing through the output of its single input unchanged.
+    '''
+
+    __slots__ = ()
+
+    operator = "UNITY"
+
+    def _step(self, inputs):
+        self.output = self.inp_1.output
+
+    def _column_op(self, columns: dict, mask: int, cache: dict) -> int:
+        return cache[self.inp_1._key]
+
+    def eval_numpy(self, columns: dict) -> np.ndarray:
+        return self.inp_1.eval_numpy(columns)
+
+    def _word_expression(self, symbol_index: dict) -> str:
+        return self.inp_1._word_expression(symbol_index)
+
+    def _int_expression(self) -> str:
+        return self.inp_1._int_expression()
+
+
+_GATE_TYPES = {
+    "INPUT": InputGate,
+    "NOT": NotGate,
+    "AND": AndGate,
+    "OR": OrGate,
+    "UNITY": UnityGate,
+}
+
+_OPERATOR_NAMES = {"*": "AND", "+": "OR"}
+_PRECEDENCE = {"*": 2, "+": 1}
+
+
+def _new_gate(
+    operator: str,
+    expression: str = "",
+    inp_1: Optional[Gate] = None,
+    inp_2: Optional[Gate] = None,
+) -> Gate:
+    '''
+        Create a Gate node of the type matching the operator directly from
+        its fields, bypassing the expression parsing in Gate.__new__.
+
+        Returns the new Gate node.
+    '''
+
+    gate = object.__new__(_GATE_TYPES[operator])
+    gate.truth_table = []
+    gate.expression = expression
+    gate.output = 0
+    gate._column = None
+    gate.inp_1 = inp_1
+    gate.inp_2 = inp_2
+
+    if operator == "INPUT":
+        gate._key = ("INPUT", expression)
+    elif inp_2 is None:
+        gate._key = (operator, inp_1._key)
+    else:
+        gate._key = (operator, inp_1._key, inp_2._key)
+
+    return gate
+
+
+def _flatten_post_order(root: Gate) -> list[Gate]:
+    '''
+        Flatten a gate tree into a post-order list with children placed
+        before their parents, so the tree can be evaluated in a plain loop
+        without recursion. Nodes reachable more than once are listed once.
+
+        root: root of the tree to flatten.
+
+        Returns list of Gates ending with the root.
+    '''
+
+    order = []
+    seen = set()
+    stack = [(root, False)]
+
+    while stack:
+        gate, visited = stack.pop()
+        if visited:
+            order.append(gate)
+            continue
+        if id(gate) in seen:
+            continue
+        seen.add(id(gate))
+
+        stack.append((gate, True))
+        if gate.inp_2 is not None:
+            stack.append((gate.inp_2, False))
+        if gate.inp_1 is not None:
+            stack.append((gate.inp_1, False))
+
+    return order
+
+
+def tokenize(fct_str: str) -> list[tuple]:
+    '''
+        Split a normalized boolean expression into tokens in a single pass.
+
+        fct_str: normalized boolean expression (see normalize_bool_fct_str).
+
+        Returns list of ("VAR", sym), ("OP", sym), ("NOT",), ("LP",) and
+        ("RP",) tuples.
+    '''
+
+    tokens = []
+    for sym in fct_str:
+        if sym.isalpha():
+            tokens.append(("VAR", sym))
+        elif sym in _OPERATOR_NAMES:
+            tokens.append(("OP", sym))
+        elif sym == "'":
+            tokens.append(("NOT",))
+        elif sym == "(":
+            tokens.append(("LP",))
+        elif sym == ")":
+            tokens.append(("RP",))
+        else:
+            raise NotImplementedError("Unknown operator encountered!")
+
+    return tokens
+
+
+@lru_cache(maxsize=1024)
+def parse_expression(fct_str: str) -> Gate:
+    '''
+        Parse a normalized boolean expression into a Gate tree with a single
+        shunting-yard pass over its token list. The postfix NOT binds to the
+        preceding variable or paranthesized group, AND binds stronger than OR.
+
+        Results are cached per normalized expression, so repeated Gate
+        constructions share the same read-only node tree.
+
+        fct_str: normalized boolean expression (see normalize_bool_fct_str).
+
+        Returns the root Gate of the parsed expression.
+    '''
+
+    operands = []
+    operators = []
+
+    def reduce_top():
+        operator = operators.pop()
+        if len(operands) < 2:
+            raise ValueError(f"Operator is missing an operand: {fct_str}!")
+        inp_2 = operands.pop()
+        inp_1 = operands.pop()
+        operands.append(_new_gate(_OPERATOR_NAMES[operator], inp_1=inp_1, inp_2=inp_2))
+
+    for token in tokenize(fct_str):
+        match token[0]:
+            case "VAR":
+                operands.append(_new_gate("INPUT", expression=token[1]))
+            case "NOT":
+                if not operands:
+                    raise ValueError(
+                        f"Expression or sub-expression cannot start with an operator: {fct_str}!"
+                    )
+                operands[-1] = _new_gate("NOT", inp_1=operands[-1])
+            case "OP":
+                while (
+                    operators
+                    and operators[-1] != "("
+                    and _PRECEDENCE[operators[-1]] >= _PRECEDENCE[token[1]]
+                ):
+                    reduce_top()
+                operators.append(token[1])
+            case "LP":
+                operators.append("(")
+            case "RP":
+                while operators and operators[-1] != "(":
+                    reduce_top()
+                if not operators:
+                    raise ValueError("Unmatched paranthesis!")
+                operators.pop()
+
+    while operators:
+        if operators[-1] == "(":
+            raise ValueError("Unmatched paranthesis!")
+        reduce_top()
+
+    if len(operands) != 1:
+        raise ValueError(f"Invalid expression: {fct_str}!")
+
+    return operands[0]
+
+
+def input_columns(input_symbols: list[str]) -> tuple[dict, int]:
+    '''
+        Precompute the packed truth-table column of every input symbol.
+
+        For n input symbols, bit i of the column of the symbol at position k
+        (counting from the left) equals the value of that symbol in row i of
+        the truth table.
+
+        input_symbols: list of input symbols in reversed alphabetical order.
+
+        Returns tuple of the symbol-to-column dict and the row bit mask.
+    '''
+
+    n_sym = len(input_symbols)
+    mask = (1 << (1 << n_sym)) - 1
+
+    columns = {}
+    for k, sym in enumerate(input_symbols):
+        period = 1 << (1 << (n_sym - k - 1))
+        columns[sym] = mask ^ mask // (period + 1)
 
+    return columns, mask
 
-def parse_outer_paranthesis(expr: str) -> (int, int):
+
+def input_columns_numpy(input_symbols: list[str]) -> dict:
     '''
-        Determines positions of the outermost opening and closing paranthesis.
+        Precompute the truth-table column of every input symbol as a
+        contiguous uint8 array with one entry per row.
 
-        expr: string that is parsed.
+        input_symbols: list of input symbols in reversed alphabetical order.
 
-        Returns tuple of integers representing the positions of the opening
-        and closing paranthesis.
+        Returns dict mapping each symbol to its column array.
     '''
 
-    i_open = -1
-    i_close = -1
-    count = 0
-    for i, sym in enumerate(expr):
-        if sym == "(":
-            if count == 0:
-                i_open = i
-            count += 1
-        if sym == ")":
-            count -= 1
-            if count == 0:
-                i_close = i
-                break
-            if i_open == -1:
-                raise ValueError("Invalid Paranthesis")
+    n_sym = len(input_symbols)
+
+    columns = {}
+    for k, sym in enumerate(input_symbols):
+        block = 1 << (n_sym - k - 1)
+        column = np.tile(np.repeat(np.array([0, 1], dtype=np.uint8), block), 1 << k)
+        columns[sym] = column
 
-    return i_open, i_close
+    return columns
 
 
-def extract_input_symbols(fct_str: str) -> list[str]:
+def input_columns_words(input_symbols: list[str]) -> np.ndarray:
     '''
-        Get list of variables in boolean expression in reversed alphabetical order.
+        Precompute the packed truth-table columns of all input symbols as
+        64-bit words. Row i of the truth table maps to bit i % 64 of word
+        i // 64, matching the bit order of input_columns.
 
-        fct_str: string representing boolean expression.
+        input_symbols: list of input symbols in reversed alphabetical order.
 
-        Returns list of input symbols.
+        Returns np.ndarray of shape (n_symbols, n_words) and dtype uint64.
     '''
 
-    input_symbols = {sym for sym in fct_str if sym.isalpha()}
-    input_symbols = sorted(list(input_symbols), reverse=True)
+    n_sym = len(input_symbols)
+    n_words = max(1 << n_sym >> 6, 1)
+    mask_64 = (1 << 64) - 1
 
-    return input_symbols
+    columns = np.empty((n_sym, n_words), dtype=np.uint64)
+    words = np.arange(n_words, dtype=np.uint64)
+
+    for k in range(n_sym):
+        shift = n_sym - k - 1
+        if shift >= 6:
+            high = words >> np.uint64(shift - 6) & np.uint64(1)
+            columns[k] = np.uint64(mask_64) * high
+        else:
+            period = 1 << (1 << shift)
+            pattern = mask_64 ^ mask_64 // (period + 1)
+            columns[k] = np.uint64(pattern)
+
+    return columns
+
+
+@lru_cache(maxsize=1024)
+def compile_column_function(expression: str):
+    '''
+        Compile the packed-column evaluation of a normalized boolean
+        expression into a single Python function of the form
+
+            def _column_function(C, B, A, mask): return ((A & B) | ...)
+
+        with one parameter per input symbol (in reversed alphabetical
+        order) plus the row mask. Calling the compiled function replaces
+        the tree walk of eval_column with straight-line bytecode; results
+        are cached per normalized expression.
+
+        expression: normalized boolean expression (see normalize_bool_fct_str).
+
+        Returns the compiled function.
+    '''
+
+    _, input_symbols = normalize_bool_fct_str(expression)
+    root = parse_expression(expression)
+
+    parameters = ", ".join(list(input_symbols) + ["mask"])
+    source = (
+        f"def _column_function({parameters}):\n"
+        f"    return {root._int_expression()}"
+    )
+
+    namespace = {}
+    exec(source, namespace)  # pylint: disable=exec-used
+
+    return namespace["_column_function"]
+
+
+def eval_column_words(circuit: Gate, input_symbols: list[str]) -> np.ndarray:
+    '''
+        Evaluate the packed output column of a circuit as an array of 64-bit
+        words using a Numba-compiled kernel. The whole gate tree is lowered
+        into one straight-line expression inside a single loop over the
+        words, which Numba can compile and auto-vectorize.
+
+        circuit: logical circuit/Gate to evaluate.
+        input_symbols: list of input symbols in reversed alphabetical order.
+
+        Returns the output column as np.ndarray of uint64.
+    '''
+
+    symbol_index = {sym: k for k, sym in enumerate(input_symbols)}
+    source = "\n".join(
+        (
+            "def _column_kernel(columns, out):",
+            "    for w in range(out.shape[0]):",
+            f"        out[w] = {circuit._word_expression(symbol_index)}",
+        )
+    )
+
+    namespace = {}
+    exec(source, namespace)  # pylint: disable=exec-used
+    kernel = njit(namespace["_column_kernel"])
+
+    columns = input_columns_words(input_symbols)
+    out = np.empty(columns.shape[1], dtype=np.uint64)
+    kernel(columns, out)
+
+    return out
 
 
 def generate_truth_table(circuit: Gate):
     '''
         Build up the truth table for a given logical circuit/Gate.
 
+        If a packed output column has already been computed for the circuit
+        (by sum_of_min_terms), the table is decoded from its bits without
+        touching the gate tree again; otherwise the output column is
+        evaluated as a whole NumPy array via eval_numpy.
+
         circuit: logical circuit/Gate for which truth table is generated.
     '''
 
-    fct_str = circuit.expression
-    input_symbols = extract_input_symbols(fct_str)
-    n_sym = len(input_symbols)
-    table = []
+    input_symbols = circuit._input_symbols
 
-    for inp in product([0, 1], repeat=n_sym):
-        inputs = dict(zip(input_symbols, inp))
-        circuit.update(inputs)
-        table.append([inp, normalize_bool(circuit.output)])
+    if circuit._column is not None:
+        n_rows = 1 << len(input_symbols)
+        raw = circuit._column.to_bytes((n_rows + 7) // 8, "little")
+        output = np.unpackbits(
+            np.frombuffer(raw, dtype=np.uint8), bitorder="little", count=n_rows
+        )
+        circuit.truth_table = output
+        return
 
-    circuit.truth_table = table
+    columns = input_columns_numpy(input_symbols)
+
+    circuit.truth_table = circuit.eval_numpy(columns)
 
 
 def read_table_from_file(filename: str) -> Table:
     '''
         Read truth table from file. The file needs to contain one column for
-        each input variable and one for the output variable. No comments or
-        empty lines are supported yet.
+        each input variable and one for the output variable. Empty lines and
+        comments starting with # are skipped.
 
         Example:
         0 0 1
@@ -213,55 +752,62 @@ def read_table_from_file(filename: str) -> Table:
 
         filename: path to file which contains truth table.
 
-        Returns the truth table as list[list[tuple[int, ...], int]]
+        Returns the truth table as Table (the output column; the input
+        values are implied by the row indices).
     '''
 
-    with open(filename, "r", encoding="utf-8") as table_file:
-        lines = table_file.readlines()
-
-    def parse_line(line: str) -> list[tuple[int], int]:
-        line = line.strip().split()
-        inp = tuple(int(i) for i in line[:-1])
-        out = int(line[-1])
-        return [inp, out]
+    arr = np.loadtxt(filename, dtype=np.uint8)
+    if arr.ndim == 1:
+        arr = arr[None, :]
 
-    line_1 = parse_line(lines[0])
-    n_inp = len(line_1[0])
+    n_inp = arr.shape[1] - 1
 
-    if len(lines) < 2**n_inp:
+    if arr.shape[0] < 2**n_inp:
         raise ValueError("Table incomplete!")
-    if len(lines) > 2**n_inp:
+    if arr.shape[0] > 2**n_inp:
         raise ValueError("Table overdefined!")
 
-    table = []
-    table.append(line_1)
+    check_table(arr[:, :-1], n_inp)
 
-    for line in lines[1:]:
-        table.append(parse_line(line))
+    return arr[:, -1]
 
-    check_table(table, n_inp)
 
-    return table
+def index_matrix(n_inp: int) -> np.ndarray:
+    '''
+        Build the inputs matrix of a complete truth table from its row
+        indices: entry (i, k) is the value of the k-th input symbol (counted
+        from the left) in row i.
 
+        n_inp: number of input variables.
 
-def check_table(table: Table, n_inp: int):
+        Returns np.ndarray of shape (2**n_inp, n_inp) and dtype uint8.
+    '''
+
+    matrix = (
+        np.arange(1 << n_inp, dtype=np.uint32)[:, None]
+        >> np.arange(n_inp - 1, -1, -1, dtype=np.uint32)
+    ) & 1
+
+    return matrix.astype(np.uint8)
+
+
+def check_table(inputs: np.ndarray, n_inp: int):
     '''
         Checks whether the inputs of a given truth table are valid
         (correct amount and order of 0s and 1s).
 
         Raises a ValueError if truth table is inconsistent.
 
-        table: truth table to be checked.
-        n_inp: number of input variables (TODO: automatically determine n_inp).
+        inputs: inputs matrix to be checked.
+        n_inp: number of input variables.
     '''
 
-    for i, inp in enumerate(product([0, 1], repeat=n_inp)):
-        table_inp = table[i][0]
+    mismatch = np.flatnonzero((inputs != index_matrix(n_inp)).any(axis=1))
 
-        if table_inp != inp:
-            raise ValueError(
-                f"Error: Truth table has wrong input values in line {i + 1}"
-            )
+    if mismatch.size:
+        raise ValueError(
+            f"Error: Truth table has wrong input values in line {mismatch[0] + 1}"
+        )
 
 
 def print_truth_table(table: Table, input_symbols: Optional[list[str]]):
@@ -272,124 +818,380 @@ def print_truth_table(table: Table, input_symbols: Optional[list[str]]):
         input_symbols: list of letters to use as names for inputs [optional]
     '''
 
+    output = table
+
     if input_symbols is None:
-        n_sym = len(table[0][0])
+        n_sym = len(output).bit_length() - 1
         input_symbols = list(string.ascii_uppercase[:n_sym])[::-1]
     else:
         n_sym = len(input_symbols)
 
-    truth_table = [
-        "\t".join(input_symbols) + "\t | F",
-        "--------" * (n_sym + 1),
-    ]
+    header = "\t".join(input_symbols) + "\t | F\n" + "--------" * (n_sym + 1) + "\n"
 
-    for line in table:
-        row = "\t".join(map(str, line[0])) + "\t | " + str(line[1])
-        truth_table.append(row)
+    rows = np.concatenate([index_matrix(n_sym), output[:, None]], axis=1)
+    buffer = io.StringIO()
+    np.savetxt(buffer, rows, fmt=["%d"] * n_sym + [" | %d"], delimiter="\t")
 
-    print("\n".join(truth_table))
+    print(header + buffer.getvalue(), end="")
 
 
-def sum_of_min_terms(circuit: Gate) -> str:
+def sum_of_min_terms(circuit: Gate, minimize: bool = False) -> str:
     '''
         Create string of canonical sum of minterms form of logical expression.
 
         circuit: logical circuit/Gate for which the canoncical form is created.
+        minimize: create a minimized sum-of-products form instead of the
+                  canonical one (see minimize_minterms).
 
         Returns string of the canonical form as "F = <sum-of-minterms>"
     '''
 
-    if len(circuit.truth_table) == 0:
-        generate_truth_table(circuit)
+    input_symbols = circuit._input_symbols
+
+    if len(circuit.truth_table):
+        if minimize:
+            indices = np.flatnonzero(circuit.truth_table)[::-1].tolist()
+            min_terms = build_minimized_terms(indices, input_symbols)
+        else:
+            min_terms = build_minterms(circuit.truth_table, input_symbols)
+    else:
+        if circuit._column is not None:
+            column = circuit._column
+        elif njit is not None and len(input_symbols) >= NUMBA_MIN_INPUTS:
+            words = eval_column_words(circuit, input_symbols)
+            column = int.from_bytes(words.astype("<u8").tobytes(), "little")
+        elif len(input_symbols) >= PARALLEL_MIN_INPUTS:
+            columns, mask = input_columns(input_symbols)
+            column = circuit.eval_column(columns, mask)
+        else:
+            columns, mask = input_columns(input_symbols)
+            function = compile_column_function(circuit.expression)
+            column = function(*(columns[sym] for sym in input_symbols), mask)
 
-    input_symbols = extract_input_symbols(circuit.expression)
+        circuit._column = column
 
-    min_terms = build_minterms(circuit.truth_table, input_symbols)
+        if minimize:
+            min_terms = build_minimized_terms(column_indices(column), input_symbols)
+        else:
+            min_terms = build_minterms(column, input_symbols)
 
     return "F = " + min_terms
 
 
-def build_minterms(table: Table, input_symbols: Optional[list[str]]) -> str:
+def column_indices(column: int) -> list[int]:
+    '''
+        List the set-bit positions of a packed output column, i.e. the
+        indices of all set minterms, from the highest index down.
+
+        column: packed output column as produced by Gate.eval_column.
+
+        Returns list of minterm indices.
+    '''
+
+    indices = []
+    while column:
+        idx = column.bit_length() - 1
+        column ^= 1 << idx
+        indices.append(idx)
+
+    return indices
+
+
+def build_minterms(
+    table: Table | int, input_symbols: Optional[list[str]], n_inp: Optional[int] = None
+) -> str:
     '''
         Determines canonical sum of minterms form from the truth table of a
         boolean expression and returns it as string.
 
+        table: either a truth table (Table) or a packed output column (int)
+               as produced by Gate.eval_column. Only the set minterms are
+               visited instead of all 2**n rows.
+        input_symbols: list of letters to use as names for inputs [optional]
+        n_inp: number of input variables; only needed when table is a packed
+               column and input_symbols is None.
+
         Returns string containing only the canonical form (without any formatting
         sugar).
     '''
 
     if input_symbols is None:
-        n_sym = len(table[0][0])
-        input_symbols = list(string.ascii_uppercase[:n_sym])[::-1]
+        if n_inp is None:
+            n_inp = len(table).bit_length() - 1
+        input_symbols = list(string.ascii_uppercase[:n_inp])[::-1]
+
+    n_sym = len(input_symbols)
+    # Literal strings per position, indexed by the bit value: entry 0 holds
+    # the primed symbols, entry 1 the plain ones.
+    literals = ([sym + "'" for sym in input_symbols], input_symbols)
+
+    if isinstance(table, int):
+        indices = column_indices(table)
+    else:
+        indices = np.flatnonzero(table)[::-1].tolist()
 
     min_terms = []
+    for idx in indices:
+        row = "".join(
+            literals[(idx >> (n_sym - i - 1)) & 1][i] for i in range(n_sym)
+        )
+        min_terms.append(row)
 
-    for line in table:
-        if line[1]:
-            inp = line[0]
-            row = [
-                input_symbols[i] if inp[i] else input_symbols[i] + "'"
-                for i in range(len(inp))
-            ]
-            min_terms.append("".join(row))
+    return " + ".join(min_terms)
 
-    min_terms = min_terms[::-1]
-    min_terms = " + ".join(min_terms)
 
-    return min_terms
+def minimize_minterms(
+    min_term_indices: list[int], n_inp: int
+) -> list[tuple[int, int]]:
+    '''
+        Determine a minimal sum-of-products cover of the given minterms with
+        the Quine-McCluskey algorithm.
+
+        Implicants are encoded as (value, mask) pairs in which mask marks
+        the don't-care bit positions and value holds the remaining fixed
+        bits. Minterms are merged level by level (merging two implicants
+        whose values differ in exactly one bit), the surviving prime
+        implicants are then reduced to a minimal cover.
 
+        min_term_indices: indices of all set minterms.
+        n_inp: number of input variables.
 
-def normalize_bool(value: bool) -> int:
+        Returns list of the selected prime implicants as (value, mask) pairs
+        in order of descending value.
     '''
-        Convert bool (True/False) to int (0/1).
 
-        value: bool value to convert.
+    primes = []
+    current = {(idx, 0) for idx in min_term_indices}
 
-        Returns 0 or 1 depending on value.
+    while current:
+        merged = set()
+        next_level = set()
+
+        grouped = {}
+        for value, mask in current:
+            grouped.setdefault((mask, bin(value).count("1")), []).append(value)
+
+        for (mask, ones), values in grouped.items():
+            partners = grouped.get((mask, ones + 1), [])
+            for value in values:
+                for partner in partners:
+                    diff = value ^ partner
+                    if diff & (diff - 1) == 0:
+                        next_level.add((value & partner, mask | diff))
+                        merged.add((value, mask))
+                        merged.add((partner, mask))
+
+        primes.extend(current - merged)
+        current = next_level
+
+    return _select_cover(primes, min_term_indices)
+
+
+# Exact Petrick's method grows exponentially with the number of uncovered
+# minterms; above this bound _select_cover falls back to a greedy cover.
+_PETRICK_MAX_TERMS = 16
+
+
+def _select_cover(
+    primes: list[tuple[int, int]], min_term_indices: list[int]
+) -> list[tuple[int, int]]:
+    '''
+        Choose a small subset of prime implicants that covers all minterms.
+        Essential prime implicants are picked first and the cover matrix is
+        repeatedly reduced by row and column dominance. A small remainder is
+        resolved exactly via Petrick's method; larger remainders fall back
+        to a greedy set cover, which stays tractable on dense tables.
+
+        primes: all prime implicants as (value, mask) pairs.
+        min_term_indices: indices of all set minterms.
+
+        Returns list of the chosen implicants in order of descending value.
+    '''
+
+    cover = {
+        idx: {prime for prime in primes if idx & ~prime[1] == prime[0]}
+        for idx in min_term_indices
+    }
+
+    chosen = set()
+
+    while cover:
+        essential = {
+            next(iter(options)) for options in cover.values() if len(options) == 1
+        }
+        if essential:
+            chosen |= essential
+            cover = {
+                idx: options
+                for idx, options in cover.items()
+                if not options & essential
+            }
+            continue
+
+        # Row dominance: a minterm whose options are a superset of another
+        # minterm's options is covered by whatever covers the other one.
+        rows = sorted(cover, key=lambda idx: len(cover[idx]))
+        dominated_rows = set()
+        for small in rows:
+            if small in dominated_rows:
+                continue
+            for large in rows:
+                if (
+                    large != small
+                    and large not in dominated_rows
+                    and cover[small] <= cover[large]
+                ):
+                    dominated_rows.add(large)
+
+        if dominated_rows:
+            cover = {
+                idx: options
+                for idx, options in cover.items()
+                if idx not in dominated_rows
+            }
+
+        # Column dominance: an implicant whose remaining coverage is a
+        # subset of another implicant's coverage can be dropped.
+        coverage = {}
+        for idx, options in cover.items():
+            for prime in options:
+                coverage.setdefault(prime, set()).add(idx)
+
+        columns = sorted(coverage, key=lambda p: len(coverage[p]), reverse=True)
+        dominated_cols = set()
+        for large in columns:
+            if large in dominated_cols:
+                continue
+            for small in columns:
+                if (
+                    small != large
+                    and small not in dominated_cols
+                    and coverage[small] <= coverage[large]
+                ):
+                    dominated_cols.add(small)
+
+        if dominated_cols:
+            cover = {
+                idx: options - dominated_cols for idx, options in cover.items()
+            }
+            continue
+
+        if not dominated_rows:
+            break
+
+    if not cover:
+        return sorted(chosen, reverse=True)
+
+    if len(cover) <= _PETRICK_MAX_TERMS:
+        products = {frozenset()}
+        for options in cover.values():
+            products = {
+                product | {prime} for product in products for prime in options
+            }
+            products = {
+                product
+                for product in products
+                if not any(other < product for other in products)
+            }
+
+        best = min(products, key=lambda product: (len(product), sorted(product)))
+        chosen |= best
+    else:
+        while cover:
+            coverage = {}
+            for idx, options in cover.items():
+                for prime in options:
+                    coverage.setdefault(prime, set()).add(idx)
+
+            best = max(coverage, key=lambda p: (len(coverage[p]), p))
+            chosen.add(best)
+            cover = {
+                idx: options
+                for idx, options in cover.items()
+                if best not in options
+            }
+
+    return sorted(chosen, reverse=True)
+
+
+def build_minimized_terms(
+    min_term_indices: list[int],
+    input_symbols: Optional[list[str]],
+    n_inp: Optional[int] = None,
+) -> str:
+    '''
+        Determines a minimized sum-of-products form from the set minterms of
+        a boolean expression and returns it as string. Unlike the canonical
+        form, each term may omit variables covered by a don't-care position;
+        a cover of the whole table is rendered as "1".
+
+        min_term_indices: indices of all set minterms.
+        input_symbols: list of letters to use as names for inputs [optional]
+        n_inp: number of input variables; only needed when input_symbols is
+               None.
+
+        Returns string containing only the minimized form (without any
+        formatting sugar).
     '''
 
-    match value:
-        case True:
-            return 1
-        case False:
-            return 0
-        case _:
-            return value
+    if input_symbols is None:
+        input_symbols = list(string.ascii_uppercase[:n_inp])[::-1]
+
+    n_sym = len(input_symbols)
+    literals = ([sym + "'" for sym in input_symbols], input_symbols)
+
+    terms = []
+    for value, mask in minimize_minterms(min_term_indices, n_sym):
+        positions = []
+        for i in range(n_sym):
+            bit = n_sym - i - 1
+            if mask >> bit & 1:
+                continue
+            positions.append(literals[value >> bit & 1][i])
+        terms.append("".join(positions) or "1")
 
+    return " + ".join(terms)
 
-def normalize_bool_fct_str(fct_str: str) -> str:
+
+@lru_cache(maxsize=1024)
+def normalize_bool_fct_str(fct_str: str) -> tuple[str, list[str]]:
     '''
-        Clean the raw form of the boolean expression given by the user.
-        Removes spaces, escape characters, etc. and inserts AND operator
-        where needed.
+        Clean the raw form of the boolean expression given by the user and
+        collect its input symbols, both in a single forward pass. Removes
+        spaces, escape characters, etc. and inserts AND operator where
+        needed. Results are cached per raw expression and must not be
+        mutated by callers.
 
         fct_str: string containing the raw form of the boolean expression.
 
-        Returns cleaned up string of boolean expression.
+        Returns tuple of the cleaned up expression string and the list of
+        input symbols in reversed alphabetical order.
     '''
 
-    fct_str = (
-        fct_str.upper()
-        .replace(" ", "")
-        .replace("\\", "")
-        .replace("!", "'")
-        .strip("*")
-        .strip("+")
-    )
-    pos = []
-    for i in range(len(fct_str) - 1):
-        sym_i = fct_str[i]
-        sym_i1 = fct_str[i + 1]
+    symbols = set()
+    out = []
 
-        if (sym_i.isalpha() or sym_i == "'") and (sym_i1.isalpha() or sym_i1 == "("):
-            pos.append(i)
-        elif sym_i == ")" and sym_i1.isalpha():
-            pos.append(i)
+    for sym in fct_str.upper():
+        if sym in " \\":
+            continue
+        if sym == "!":
+            sym = "'"
 
-    for i in reversed(pos):
-        fct_str = fct_str[: i + 1] + "*" + fct_str[i + 1 :]
+        if sym.isalpha():
+            symbols.add(sym)
 
-    return fct_str
+        if out:
+            prev = out[-1]
+            if (prev.isalpha() or prev == "'") and (sym.isalpha() or sym == "("):
+                out.append("*")
+            elif prev == ")" and sym.isalpha():
+                out.append("*")
+
+        out.append(sym)
+
+    fct_str = "".join(out).strip("*").strip("+")
+
+    return fct_str, sorted(symbols, reverse=True)
 
 
 def main(args):
@@ -407,6 +1209,12 @@ def main(args):
         "--read-table",
         help="Read truth table from file and print sum of minterms",
     )
+    parser.add_argument(
+        "-m",
+        "--minimize",
+        action="store_true",
+        help="Additionally print a minimized sum-of-products form (Quine-McCluskey)",
+    )
     args = parser.parse_args()
 
     if args.function is not None:
@@ -416,6 +1224,10 @@ def main(args):
         print("Canonical form of F in sum-of-minterms notation:")
         circuit.print_sum_of_minterms()
 
+        if args.minimize:
+            print("Minimized form of F:")
+            circuit.print_sum_of_minterms(minimize=True)
+
         if args.table:
             print("Truth Table:")
             circuit.print_truth_table()
@@ -427,6 +1239,11 @@ def main(args):
         print("Canonical form of F in sum-of-minterms notation:")
         print("F = " + min_terms)
 
+        if args.minimize:
+            indices = np.flatnonzero(table)[::-1].tolist()
+            print("Minimized form of F:")
+            print("F = " + build_minimized_terms(indices, None, len(table).bit_length() - 1))
+
         if args.table:
             print("Truth Table:")
             print_truth_table(table, None)